@@ -1,14 +1,21 @@
 #!/home/clawd/.openclaw/venvs/trading-bot/bin/python3"""Check deportation market end dates"""
 import asyncio
+import re
 from utils.polymarket_api import PolymarketClient
 
+_DEPORT_RE = re.compile(r"deport", re.IGNORECASE)
+_DEPORT_BYTES_RE = re.compile(rb"deport", re.IGNORECASE)
+
 async def check():
     c = PolymarketClient()
-    markets = await c.get_markets(active=True, limit=50)
+    try:
+        markets = await c.get_markets(active=True, limit=50, query="deport", match=_DEPORT_BYTES_RE)
+    finally:
+        await c.close()
     
     for m in markets:
         q = m.get("question", "")
-        if "deport" in q.lower():
+        if _DEPORT_RE.search(q):
             print(f"{q}")
             print(f"  End: {m.get('endDate', 'N/A')}")
             vol = float(m.get('volume', 0) or 0) / 1000
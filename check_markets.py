@@ -2,24 +2,30 @@
 """Check available markets - filter by category"""
 import asyncio, sys
 from datetime import datetime
+import numpy as np
 from utils.polymarket_api import PolymarketClient
+from utils.category_matcher import CategoryMatcher
+from utils.market_data import project
+
+# Checked in priority order - first category with a keyword hit wins
+CATEGORY_WORDS = {
+    "crypto": ["bitcoin", "btc", "crypto", "ethereum"],
+    "politics": ["trump", "biden", "election", "senate", "congress", "elon", "doge", "federal", "deport"],
+    "sports": ["super bowl", "nba", "nfl", "championship", "team", "game", "score", "win", "soccer", "football", "basketball"],
+    "gaming": ["gta", "game", "cost", "$100"],
+}
+
+_matcher = CategoryMatcher(CATEGORY_WORDS)
 
 def detect_category(question):
-    q = question.lower()
-    if any(w in q for w in ["bitcoin", "btc", "crypto", "ethereum"]):
-        return "crypto"
-    elif any(w in q for w in ["trump", "biden", "election", "senate", "congress", "elon", "doge", "federal", "deport"]):
-        return "politics"
-    elif any(w in q for w in ["super bowl", "nba", "nfl", "championship", "team", "game", "score", "win", "soccer", "football", "basketball"]):
-        return "sports"
-    elif any(w in q for w in ["gta", "game", "cost", "$100"]):
-        return "gaming"
-    else:
-        return "other"
+    return _matcher.detect(question)
 
 async def main():
     c = PolymarketClient()
-    markets = await c.get_markets(active=True, limit=50)
+    try:
+        markets = await c.get_markets(active=True, limit=50)
+    finally:
+        await c.close()
     
     print(f'Found {len(markets)} markets\n')
     
@@ -29,34 +35,20 @@ async def main():
     print(f'END DATE     | CAT      | YES    | VOLUME   | MARKET')
     print('='*80)
     
-    sports_count = 0
+    # Parse the columns once, up front, instead of per printed row
+    cols = project(markets)
+    yes_prices = cols['yes'] * 100.0
+    volumes = cols['volume'] / 1000.0
+    categories = np.array([detect_category(q) for q in cols['question']], dtype=object)
+    
+    # Show sports or all
+    shown = np.flatnonzero(categories == category_filter) if category_filter else np.arange(len(markets))
+    sports_count = int(np.count_nonzero(categories[shown] == "sports"))
     
-    for m in markets:
-        question = m.get('question', '')
-        end_date = m.get('endDate', '')[:10] if m.get('endDate') else 'N/A'
-        
-        # Try to get price
-        try:
-            yes_price = float(m.get('prices', {}).get('yes', 0)) * 100
-        except:
-            yes_price = 0
-            
-        try:
-            volume = float(m.get('volume', 0)) / 1000
-        except:
-            volume = 0
-            
-        category = detect_category(question)
-        
-        # Show sports or all
-        if category_filter:
-            if category != category_filter:
-                continue
-        
-        if category == "sports":
-            sports_count += 1
-            
-        print(f'{end_date:12} | {category:8} | {yes_price:5.0f}% | {volume:6.0f}K | {question[:40]}...')
+    for i in shown:
+        question = cols['question'][i]
+        end_date = cols['end'][i][:10] or 'N/A'
+        print(f'{end_date:12} | {categories[i]:8} | {yes_prices[i]:5.0f}% | {volumes[i]:6.0f}K | {question[:40]}...')
 
     print(f'\n{sports_count} sports markets found')
 
@@ -1,22 +1,29 @@
 #!/home/clawd/.openclaw/venvs/trading-bot/bin/python3
 """Check if markets are resolved"""
 import asyncio
+import re
 from utils.polymarket_api import PolymarketClient
 
+_DEPORT_RE = re.compile(r"deport", re.IGNORECASE)
+_DEPORT_BYTES_RE = re.compile(rb"deport", re.IGNORECASE)
+
 async def check():
     c = PolymarketClient()
     
     # Get both active and closed markets
-    all_markets = await c.get_markets(active=True, limit=100)
+    try:
+        all_markets = await c.get_markets(active=True, limit=100, query="deport", match=_DEPORT_BYTES_RE)
+    finally:
+        await c.close()
     
     print("Checking deportation markets...")
-    print(f"Total active markets: {len(all_markets)}")
+    print(f"Active markets matching 'deport': {len(all_markets)}")
     print()
     
     deport_markets = []
     for m in all_markets:
         q = m.get("question", "")
-        if "deport" in q.lower():
+        if _DEPORT_RE.search(q):
             deport_markets.append(m)
             
             print(f"Market: {q}")
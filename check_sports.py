@@ -1,25 +1,22 @@
 #!/home/clawd/.openclaw/venvs/trading-bot/bin/python3
 """Check all markets - raw output"""
 import asyncio, json
-import requests
+from utils.http_client import get_session, close_session
+from utils.market_cache import get_markets_cached
+from utils.constants import SPORTS_RE
 
 async def main():
-    # Try different endpoints
-    host = "https://gamma-api.polymarket.com"
-    
     # Get markets with larger limit
-    response = requests.get(
-        f"{host}/markets",
-        params={
+    session = get_session()
+    try:
+        markets = await get_markets_cached(session, {
             "active": "true", 
             "closed": "false", 
             "limit": 100,
             "sort": "volume"  # Sort by volume to get popular ones
-        },
-        timeout=15
-    )
-    
-    markets = response.json()
+        })
+    finally:
+        await close_session()
     print(f"Fetched {len(markets)} markets\n")
     
     # Show all markets with their tags
@@ -31,11 +28,7 @@ async def main():
         slug = m.get('slug', '')
         
         # Check if sports-related
-        is_sports = any(word in question.lower() for word in [
-            'nba', 'nfl', 'super bowl', 'championship', 'playoff',
-            'team', 'game', 'match', 'score', 'win', 'soccer', 
-            'football', 'basketball', 'baseball', 'hockey', 'tennis'
-        ])
+        is_sports = SPORTS_RE.search(question) is not None
         
         marker = "🏈 SPORTS" if is_sports else f"  {tags[0] if tags else 'other'}"
         
@@ -1,27 +1,31 @@
 #!/home/clawd/.openclaw/venvs/trading-bot/bin/python3
 """Fetch LIVE events using correct API endpoint"""
 import asyncio
-import requests
 from datetime import datetime, timezone
+from utils.http_client import get_session, close_session, fetch_json
+from utils.market_data import project, to_epoch
+from utils.constants import GAMMA_HOST
 
 async def main():
-    host = "https://gamma-api.polymarket.com"
-    
     print("="*70)
     print("LIVE EVENTS (using /events with active=true&closed=false)")
     print("="*70)
     
     # Get live events
-    r = requests.get(
-        f"{host}/events?active=true&closed=false&limit=50",
-        timeout=15
-    )
-    events = r.json()
+    session = get_session()
+    try:
+        events = await fetch_json(
+            session,
+            f"{GAMMA_HOST}/events",
+            {"active": "true", "closed": "false", "limit": 50}
+        )
+    finally:
+        await close_session()
     
     print(f"\nFound {len(events)} live events")
     print()
     
-    now = datetime.now(timezone.utc)
+    now_epoch = int(datetime.now(timezone.utc).timestamp())
     
     for i, e in enumerate(events[:15]):
         title = e.get("title", "N/A")
@@ -34,9 +38,8 @@ async def main():
         days_until = "N/A"
         if end_date:
             try:
-                end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00')).replace(tzinfo=timezone.utc)
-                days_until = (end_dt - now).days
-            except:
+                days_until = (to_epoch(end_date) - now_epoch) // 86400
+            except ValueError:
                 pass
         
         print(f"{i+1}. {title}")
@@ -46,11 +49,9 @@ async def main():
         
         # Show markets within event
         markets = e.get("markets", [])
-        for m in markets[:2]:
-            question = m.get("question", "")
-            prices = m.get("prices", {})
-            yes_price = prices.get("yes", 0) * 100
-            print(f"   -> {question[:50]}... (YES: {yes_price:.0f}%)")
+        shown = project(markets[:2])
+        for question, yes in zip(shown["question"], shown["yes"]):
+            print(f"   -> {question[:50]}... (YES: {yes * 100:.0f}%)")
         if len(markets) > 2:
             print(f"   ... and {len(markets)-2} more markets")
         print()
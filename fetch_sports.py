@@ -1,18 +1,24 @@
 #!/home/clawd/.openclaw/venvs/trading-bot/bin/python3
-import requests, json, asyncio
-from datetime import datetime
+import json, asyncio
+import numpy as np
+from utils.http_client import get_session, close_session
+from utils.market_cache import get_markets_cached
+from utils.market_data import project
+from utils.constants import SPORTS_RE
 
-host = "https://gamma-api.polymarket.com"
+def _to_datetime64(end_date):
+    """ISO endDate -> datetime64[s] (UTC), NaT when missing or malformed"""
+    try:
+        return np.datetime64(end_date[:19], 's')
+    except (TypeError, ValueError):
+        return np.datetime64('NaT', 's')
 
-def fetch_by_category(category, limit=50):
+async def fetch_by_category(session, category, limit=50):
     """Fetch markets by category field"""
     try:
-        r = requests.get(
-            f"{host}/markets",
-            params={"category": category, "active": "true", "limit": limit},
-            timeout=15
+        return await get_markets_cached(
+            session, {"category": category, "active": "true", "limit": limit}
         )
-        return r.json()
     except Exception as e:
         print(f"Error: {e}")
         return []
@@ -27,20 +33,25 @@ async def main():
     print(f"{'Category':<15} {'Markets':<10} {'End Soonest'}")
     print("-" * 60)
     
-    for cat in categories:
-        markets = fetch_by_category(cat, limit=20)
+    session = get_session()
+    try:
+        # Probe all categories concurrently instead of one request at a time
+        tasks = [fetch_by_category(session, cat, 20) for cat in categories]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        all_markets = await get_markets_cached(session, {"active": "true", "limit": 300})
+    finally:
+        await close_session()
+    
+    for cat, markets in zip(categories, results):
+        if isinstance(markets, Exception):
+            print(f"Error: {markets}")
+            continue
         if markets and len(markets) > 0:
-            # Get nearest end date
-            end_dates = []
-            for m in markets:
-                ed = m.get('endDate')
-                if ed:
-                    try:
-                        end_dates.append(datetime.fromisoformat(ed.replace('Z', '+00:00')))
-                    except:
-                        pass
-            
-            nearest = min(end_dates).strftime('%Y-%m-%d') if end_dates else 'N/A'
+            # Get nearest end date - ISO8601 UTC strings sort chronologically,
+            # so no need to parse them
+            nearest = min((m.get('endDate') for m in markets if m.get('endDate')), default=None)
+            nearest = nearest[:10] if nearest else 'N/A'
             print(f"{cat:<15} {len(markets):<10} {nearest}")
             
             # Show sample
@@ -52,39 +63,25 @@ async def main():
     print("Scanning ALL markets for sports keywords")
     print("="*60)
     
-    all_markets = requests.get(f"{host}/markets?active=true&limit=300").json()
-    
-    sports_keywords = ['nba', 'nfl', 'nhl', 'playoff', 'championship', 'bulls', 'lakers', 
-                       'celtics', 'warriors', 'knicks', 'pacers', 'bucks', 'heat', 'magic',
-                       'suns', 'thunder', 'nuggets', 'timberwolves',
-                       'soccer', 'uefa', 'epl', 'la liga', 'bundesliga', 'champions',
-                       'tennis', 'ufc', 'atp', 'wta', 'lol', 'valorant', 'dota', 'cs2']
+    matched = [m for m in all_markets if SPORTS_RE.search(m.get('question', '')) is not None]
+    cols = project(matched)
     
-    sports_markets = []
-    for m in all_markets:
-        q = m.get('question', '').lower()
-        if any(kw in q for kw in sports_keywords):
-            # Check if recently ending
-            end = m.get('endDate', '')
-            try:
-                end_dt = datetime.fromisoformat(end.replace('Z', '+00:00'))
-                days_until = (end_dt - datetime.now(end_dt.tzinfo)).days
-            except:
-                days_until = 999
-            
-            sports_markets.append((m, days_until))
+    # Check if recently ending - days until end for every match in one array op
+    ends = np.array([_to_datetime64(ed) for ed in cols['end']], dtype='datetime64[s]')
+    seconds_left = (ends - np.datetime64('now', 's')).astype(np.int64)
+    days = np.where(np.isnat(ends), 999, seconds_left // 86400)
     
     # Sort by days until end
-    sports_markets.sort(key=lambda x: x[1])
+    order = np.argsort(days, kind='stable')
     
-    print(f"\nFound {len(sports_markets)} sports markets")
+    print(f"\nFound {len(matched)} sports markets")
     print("\nEnding SOONEST (next 7 days):")
     print("-"*70)
     
-    for m, days in sports_markets[:10]:
-        if days < 7:
-            print(f"{days:2}d | {m.get('endDate', 'N/A')[:10]} | {m.get('question', 'N/A')[:55]}...")
-            print(f"     Vol: ${float(m.get('volume', 0))/1000:.0f}K | Yes: {float(m.get('prices', {}).get('yes', 0))*100:.0f}%")
+    for i in order[:10]:
+        if days[i] < 7:
+            print(f"{days[i]:2}d | {cols['end'][i][:10] or 'N/A'} | {cols['question'][i][:55]}...")
+            print(f"     Vol: ${cols['volume'][i]/1000:.0f}K | Yes: {cols['yes'][i]*100:.0f}%")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,12 +1,13 @@
 #!/home/clawd/.openclaw/venvs/trading-bot/bin/python3
 """Fetch TRENDING markets from Polymarket"""
 import asyncio
-import requests
+import heapq
 from datetime import datetime, timezone
+from utils.http_client import get_session, close_session
+from utils.market_cache import get_markets_cached
+from utils.market_data import project, to_epoch
 
 async def main():
-    host = "https://gamma-api.polymarket.com"
-    
     print("Fetching trending/popular markets...")
     print("="*70)
     
@@ -19,49 +20,59 @@ async def main():
     ]
     
     all_markets = {}
+    session = get_session()
+    
+    # All endpoints are independent - fire them together
+    try:
+        responses = await asyncio.gather(
+            *(get_markets_cached(session, p) for p in endpoints),
+            return_exceptions=True
+        )
+    finally:
+        await close_session()
+    
+    for params, markets in zip(endpoints, responses):
+        if isinstance(markets, Exception):
+            print(f"Error with {params}: {markets}")
+            continue
+        print(f"\nParams: {params}")
+        print(f"Markets: {len(markets)}")
+        
+        for m in markets:
+            mid = m.get("id")
+            if mid not in all_markets:
+                all_markets[mid] = m
+    
+    markets = list(all_markets.values())
+    cols = project(markets)
     
-    for params in endpoints:
-        try:
-            r = requests.get(f"{host}/markets", params=params, timeout=15)
-            markets = r.json()
-            print(f"\nParams: {params}")
-            print(f"Markets: {len(markets)}")
-            
-            for m in markets:
-                mid = m.get("id")
-                if mid not in all_markets:
-                    all_markets[mid] = m
-        except Exception as e:
-            print(f"Error with {params}: {e}")
+    volumes = cols["volume"].tolist()
     
-    # Sort by volume
-    sorted_markets = sorted(all_markets.values(), 
-                           key=lambda x: float(x.get("volume", 0) or 0), 
-                           reverse=True)
+    # Top-K by volume - O(N log K), no full sort needed
+    top = heapq.nlargest(20, range(len(markets)), key=volumes.__getitem__)
     
-    now = datetime.now(timezone.utc)
+    now_epoch = int(datetime.now(timezone.utc).timestamp())
     
     print(f"\n\nTOP 20 MARKETS BY VOLUME:")
     print("="*70)
     print(f"{'Volume':<12} | {'End':<12} | Market")
     print("-"*70)
     
-    for m in sorted_markets[:20]:
-        vol = float(m.get("volume", 0) or 0) / 1000
-        end = m.get("endDate", "N/A")[:10] if m.get("endDate") else "N/A"
-        q = m.get("question", "N/A")[:45]
+    for i in top:
+        vol = volumes[i] / 1000
+        end = cols["end"][i][:10] or "N/A"
+        q = cols["question"][i][:45]
         
         # Check if ended
         status = ""
         if end != "N/A":
             try:
-                end_dt = datetime.fromisoformat(end.replace('Z', '+00:00')).replace(tzinfo=timezone.utc)
-                days = (end_dt - now).days
+                days = (to_epoch(end) - now_epoch) // 86400
                 if days < 0:
                     status = "[ENDED]"
                 else:
                     status = f"[{days}d]"
-            except:
+            except ValueError:
                 pass
         
         print(f"${vol:>10.0f}K | {end:<12} | {q}... {status}")
@@ -71,15 +82,16 @@ async def main():
     print("="*70)
     
     # Filter for markets with recent activity
-    recent = [m for m in sorted_markets if m.get("active") and 
-              float(m.get("volume", 0) or 0) > 1000000][:10]
+    recent = heapq.nlargest(
+        10,
+        (i for i in range(len(markets)) if markets[i].get("active") and volumes[i] > 1000000),
+        key=volumes.__getitem__
+    )
     
-    for m in recent:
-        vol = float(m.get("volume", 0) or 0) / 1000
-        end = m.get("endDate", "N/A")[:10] if m.get("endDate") else "N/A"
-        q = m.get("question", "N/A")[:50]
-        prices = m.get("prices", {})
-        yes = prices.get("yes", 0)
+    for i in recent:
+        vol = volumes[i] / 1000
+        q = cols["question"][i][:50]
+        yes = cols["yes"][i]
         
         print(f"${vol:>8.0f}K | YES: {yes*100:.0f}% | {q}...")
 
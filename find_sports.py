@@ -1,21 +1,31 @@
 #!/home/clawd/.openclaw/venvs/trading-bot/bin/python3
 """Find sports markets via different endpoints"""
-import asyncio, json
-import requests
+import asyncio
+from utils.http_client import get_session, close_session, fetch_json
+from utils.market_cache import get_markets_cached
+from utils.constants import GAMMA_HOST, keyword_re
+
+event_keywords = ['nba', 'nfl', 'sports', 'game', 'match', 'championship', 'super bowl', 'soccer', 'football']
+# Scanned over question + description, so stick to unambiguous sport words
+# (no team names like "heat"/"magic" that show up in ordinary prose)
+sports_keywords = ['nba', 'nfl', 'playoff', 'championship', 'super bowl', 'world cup', 'soccer', 'football', 'basketball']
+
+EVENT_RE = keyword_re(event_keywords)
+SPORTS_RE = keyword_re(sports_keywords)
 
 async def main():
-    host = "https://gamma-api.polymarket.com"
+    session = get_session()
     
     # Try events endpoint
     print("=== EVENTS ===")
     try:
-        events = requests.get(f"{host}/events?active=true&limit=50", timeout=15).json()
+        events = await fetch_json(session, f"{GAMMA_HOST}/events", {"active": "true", "limit": 50})
         print(f"Found {len(events)} events\n")
         
         sports_events = []
         for e in events[:20]:
             title = e.get('title', '')
-            if any(word in title.lower() for word in ['nba', 'nfl', 'sports', 'game', 'match', 'championship', 'super bowl', 'soccer', 'football']):
+            if EVENT_RE.search(title) is not None:
                 sports_events.append(e)
                 print(f"🏈 {title}")
                 print(f"   End: {e.get('endDate', 'N/A')}")
@@ -34,7 +44,10 @@ async def main():
     
     # Try markets with category filter
     print("\n=== MARKETS WITH TAGS ===")
-    markets = requests.get(f"{host}/markets?active=true&limit=100", timeout=15).json()
+    try:
+        markets = await get_markets_cached(session, {"active": "true", "limit": 100})
+    finally:
+        await close_session()
     
     # Count by tag
     tag_counts = {}
@@ -48,12 +61,10 @@ async def main():
     
     # Look for sports in description
     print("\n=== SEARCHING FOR SPORTS KEYWORDS ===")
-    sports_keywords = ['nba', 'nfl', 'playoff', 'championship', 'super bowl', 'world cup', 'soccer', 'football', 'basketball']
-    
     found = 0
     for m in markets:
-        text = f"{m.get('question', '')} {m.get('description', '')}".lower()
-        if any(kw in text for kw in sports_keywords):
+        text = f"{m.get('question', '')} {m.get('description', '')}"
+        if SPORTS_RE.search(text) is not None:
             found += 1
             print(f"🏈 {m.get('question')[:60]}...")
             print(f"   End: {m.get('endDate', 'N/A')}")
@@ -1,15 +1,26 @@
 #!/home/clawd/.openclaw/venvs/trading-bot/bin/python3
 """Get ALL markets - trying different approaches"""
-import requests
-import json
+import importlib.util
+import httpx
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional - stdlib json decodes the same data
+    import json as _json
+from utils.constants import GAMMA_HOST
 
-host = "https://gamma-api.polymarket.com"
+# One keep-alive connection for every request below (same host, so one TLS
+# handshake). HTTP/2 needs the optional h2 package - use it only if present
+client = httpx.Client(
+    http2=importlib.util.find_spec("h2") is not None,
+    timeout=15.0,
+    limits=httpx.Limits(max_keepalive_connections=1)
+)
 
 def fetch_markets(params):
     """Fetch markets with given params"""
     try:
-        r = requests.get(f"{host}/markets", params=params, timeout=15)
-        return r.json()
+        r = client.get(f"{GAMMA_HOST}/markets", params=params)
+        return _json.loads(r.content)
     except Exception as e:
         print(f"Error: {e}")
         return []
@@ -17,8 +28,8 @@ def fetch_markets(params):
 def fetch_events():
     """Fetch events"""
     try:
-        r = requests.get(f"{host}/events?active=true&limit=100", timeout=15)
-        return r.json()
+        r = client.get(f"{GAMMA_HOST}/events", params={"active": "true", "limit": 100})
+        return _json.loads(r.content)
     except Exception as e:
         print(f"Error: {e}")
         return []
@@ -8,11 +8,19 @@ import os
 import sys
 import json
 import asyncio
+import functools
+from types import MappingProxyType
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import logging
 
+import numpy as np
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional - stdlib json decodes the same data
+    import json as _json
+
 # Setup paths
 BASE_DIR = Path(__file__).parent
 sys.path.insert(0, str(BASE_DIR))
@@ -21,6 +29,7 @@ from strategies.predictor import MarketAnalyzer
 from strategies.risk_manager import RiskManager
 from utils.polymarket_api import PolymarketClient
 from utils.data_feed import DataAggregator
+from utils.jit import njit
 
 # Configuration
 COFIG_FILE = BASE_DIR / "config" / "settings.json"
@@ -39,6 +48,39 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_config_cached() -> MappingProxyType:
+    """Load configuration from file (read and parsed once per process)."""
+    default_config = {
+        "max_trade_size": 50,  # USDC
+        "daily_loss_limit": -3,  # R units
+        "min_confidence": 0.65,  # 65% confidence threshold
+        "max_open_positions": 5,
+        "markets_to_track": [
+            "politics", "crypto", "sports", "technology"
+        ],
+        "prediction_model": "ensemble",
+        "auto_execute": False,  # Manual approval by default
+    }
+    
+    if COFIG_FILE.exists():
+        default_config.update(_json.loads(COFIG_FILE.read_bytes()))
+    
+    # Read-only: every bot instance shares this one mapping
+    return MappingProxyType(default_config)
+
+
+@njit(cache=True)
+def edges_vec(pred_probs, confidences, yes_prices):
+    """
+    Expected edge vs market odds for every candidate at once:
+    edge = |predicted probability - market YES price| * confidence.
+    Takes equal-length float64 arrays; the market price defaults to 0.5
+    upstream when a market has no `yes_price`.
+    """
+    return np.abs(pred_probs - yes_prices) * confidences
+
+
 class PolymarketBot:
     """
     AI-powered prediction market trading bot.
@@ -50,28 +92,7 @@ class PolymarketBot:
         self.risk_manager = RiskManager()
         self.data_feed = DataAggregator()
         self.active_positions = {}
-        self.config = self._load_config()
-        
-    def _load_config(self) -> Dict:
-        """Load configuration from file."""
-        default_config = {
-            "max_trade_size": 50,  # USDC
-            "daily_loss_limit": -3,  # R units
-            "min_confidence": 0.65,  # 65% confidence threshold
-            "max_open_positions": 5,
-            "markets_to_track": [
-                "politics", "crypto", "sports", "technology"
-            ],
-            "prediction_model": "ensemble",
-            "auto_execute": False,  # Manual approval by default
-        }
-        
-        if COFIG_FILE.exists():
-            with open(COFIG_FILE) as f:
-                loaded = json.load(f)
-                default_config.update(loaded)
-        
-        return default_config
+        self.config = _load_config_cached()
     
     async def initialize(self):
         """Initialize API connection."""
@@ -101,7 +122,7 @@ class PolymarketBot:
         """
         logger.info("Scanning markets...")
         
-        opportunities = []
+        candidates = []
         
         try:
             # Fetch active markets
@@ -109,37 +130,45 @@ class PolymarketBot:
                 categories=self.config["markets_to_track"]
             )
             
-            for market in markets:
-                # Analyze market
-                prediction = await self.analyzer.analyze_market(market)
-                
+            # Analyze markets concurrently; the semaphore caps in-flight
+            # analyzer calls so news/LLM backends aren't flooded
+            sem = asyncio.Semaphore(10)
+            
+            async def _one(market):
+                async with sem:
+                    prediction = await self.analyzer.analyze_market(market)
+                return market, prediction
+            
+            results = await asyncio.gather(*(_one(m) for m in markets))
+            
+            for market, prediction in results:
                 if prediction["confidence"] >= self.config["min_confidence"]:
-                    opportunities.append({
-                        "market": market,
-                        "prediction": prediction,
-                        "edge": self._calculate_edge(prediction, market)
-                    })
+                    candidates.append((market, prediction))
             
-            # Sort by edge (highest first)
-            opportunities.sort(key=lambda x: x["edge"], reverse=True)
+            if not candidates:
+                return []
+            
+            # Score all candidates in one vectorized call (see edges_vec for the formula)
+            n = len(candidates)
+            predicted = np.fromiter((p["probability"] for _, p in candidates), dtype=np.float64, count=n)
+            conf = np.fromiter((p["confidence"] for _, p in candidates), dtype=np.float64, count=n)
+            yes = np.fromiter((m.get("yes_price", 0.5) for m, _ in candidates), dtype=np.float64, count=n)
+            edges = edges_vec(predicted, conf, yes)
             
-            return opportunities
+            # Sort by edge (highest first)
+            return [
+                {
+                    "market": candidates[i][0],
+                    "prediction": candidates[i][1],
+                    "edge": float(edges[i])
+                }
+                for i in np.argsort(-edges, kind="stable")
+            ]
             
         except Exception as e:
             logger.error(f"Market scan failed: {e}")
             return []
     
-    def _calculate_edge(self, prediction: Dict, market: Dict) -> float:
-        """
-        Calculate expected edge vs market odds.
-        """
-        predicted_prob = prediction["probability"]
-        market_odds = market.get("yes_price", 0.5)
-        
-        # Edge = |predicted - market| * confidence
-        edge = abs(predicted_prob - market_odds) * prediction["confidence"]
-        return edge
-    
     async def evaluate_position(self, opportunity: Dict) -> Optional[Dict]:
         """
         Evaluate if we should take a position.
@@ -204,16 +233,34 @@ class PolymarketBot:
         """
         Monitor open positions for exits.
         """
-        for market_id, position in list(self.active_positions.items()):
-            market = await self.client.get_market(market_id)
+        market_ids = list(self.active_positions)
+        
+        # Refresh every position concurrently
+        markets = await self.client.get_markets_bulk(market_ids, use_cache=False)
+        
+        unresolved = []
+        for market_id, market in zip(market_ids, markets):
+            if not market:
+                logger.error(f"Failed to refresh {market_id}")
+                continue
             
             if market.get("resolved"):
                 del self.active_positions[market_id]
                 logger.info(f"Position resolved: {market_id}")
                 continue
             
-            # Check for exit signals
-            current_prediction = await self.analyzer.analyze_market(market)
+            unresolved.append((market_id, market))
+        
+        # Check for exit signals
+        predictions = await asyncio.gather(
+            *(self.analyzer.analyze_market(market, use_cache=False) for _, market in unresolved),
+            return_exceptions=True
+        )
+        
+        for (market_id, _), current_prediction in zip(unresolved, predictions):
+            if isinstance(current_prediction, Exception):
+                logger.error(f"Analysis failed for {market_id}: {current_prediction}")
+                continue
             
             if current_prediction["confidence"] < 0.5:
                 # Confidence dropped, consider exit
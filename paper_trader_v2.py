@@ -4,7 +4,7 @@ Paper Trading Mode for Polymarket
 Predicts + tracks outcomes, no real money risk.
 """
 
-import sqlite3
+import os
 import asyncio
 import json
 import re
@@ -12,52 +12,46 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from aiolimiter import AsyncLimiter
+
 from utils.polymarket_api import PolymarketClient
 from utils.tavily_predictor import WebPredictor
+from utils.category_matcher import CategoryMatcher
+from utils.paper_trading import open_paper_db, parse_iso_z, select_trades, log_predictions
 
 PAPER_DB = Path(__file__).parent / "data" / "paper_trades.sqlite"
 
+_YEAR_RE = re.compile(r"20\d\d")
+
+# Checked in priority order - first category with a keyword hit wins
+CATEGORIES = {
+    "crypto": ["bitcoin", "btc", "crypto", "ethereum"],
+    "politics": ["trump", "biden", "election", "senate"],
+    "sports": ["super bowl", "nba", "nfl", "championship"],
+}
+
+
 class PaperTrader:
     """
     Paper trading bot for Polymarket.
     """
     
+    # Built once, shared by every instance
+    _category_matcher = CategoryMatcher(CATEGORIES)
+    
     def __init__(self):
         self.client = PolymarketClient()
         self.predictor = WebPredictor()
-        self.db = self._init_db()
+        self.db = open_paper_db(PAPER_DB)
+        # Concurrency cap (in-flight searches) and rate cap (searches/sec)
+        self._sem = asyncio.Semaphore(int(os.getenv("PREDICT_CONCURRENCY", "12")))
+        self._rate = AsyncLimiter(10, 1)
         self.current_year = datetime.now(timezone.utc).year
         
-    def _init_db(self) -> sqlite3.Connection:
-        """Initialize paper trading database"""
-        PAPER_DB.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(PAPER_DB))
-        
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS paper_predictions (
-                id INTEGER PRIMARY KEY,
-                market_id TEXT NOT NULL,
-                question TEXT,
-                category TEXT,
-                our_prediction REAL,
-                market_odds REAL,
-                direction TEXT,
-                confidence REAL,
-                edge REAL,
-                sentiment_score REAL,
-                reasoning TEXT,
-                trade_size REAL,
-                open_time TEXT,
-                resolve_time TEXT,
-                outcome TEXT,
-                resolved_value REAL,
-                pnl REAL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        conn.commit()
-        return conn
+    async def close(self):
+        """Release the pooled HTTP clients (the DB connection stays open)"""
+        await self.client.close()
+        await self.predictor.close()
     
     async def scan_and_predict(self, max_markets: int = 100, days_ahead: int = 30):
         """
@@ -72,137 +66,95 @@ class PaperTrader:
         # Fetch events (correct endpoint for live data)
         events = await self.client.get_events(active=True, limit=max_markets)
         
-        # Flatten events into markets
-        markets = []
-        for event in events:
-            event_markets = event.get("markets", [])
-            for market in event_markets:
-                market["event_title"] = event.get("title", "")
-                market["event_end_date"] = event.get("endDate", "")
-                markets.append(market)
+        # Flatten events into markets (copies - the API dicts stay untouched)
+        markets = [
+            dict(market, event_title=event.get("title", ""), event_end_date=event.get("endDate", ""))
+            for event in events
+            for market in event.get("markets", [])
+        ]
         
         print(f"Scanned {len(events)} events ({len(markets)} total markets)")
         
-        predictions = []
         skipped_date = 0
         skipped_year = 0
         
+        # One clock read for the whole scan
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
+        
+        # Cheap local filters first, so only live markets cost a search
+        candidates = []
         for market in markets:
-            pred = await self._analyze_market(market, days_ahead)
-            if pred == "SKIPPED_DATE":
+            skip = self._filter_market(market, days_ahead, now)
+            if skip == "SKIPPED_DATE":
                 skipped_date += 1
-            elif pred == "SKIPPED_YEAR":
+            elif skip == "SKIPPED_YEAR":
                 skipped_year += 1
-            elif pred:
-                predictions.append(pred)
+            elif not skip:
+                question = market.get("question", "")
+                candidates.append((market, question, self._detect_category(question)))
         
         print(f"\nFiltered: {skipped_date} (past date), {skipped_year} (past year)")
         
-        self._log_predictions(predictions)
+        # One batched predictor call for every surviving market
+        results = await self.predictor.predict_batch(
+            [(question, category) for _, question, category in candidates],
+            semaphore=self._sem,
+            limiter=self._rate
+        )
+        
+        scored = []
+        for candidate, prediction in zip(candidates, results):
+            if isinstance(prediction, Exception):
+                print(f"Prediction failed: {prediction}")
+                continue
+            scored.append((*candidate, prediction))
+        
+        predictions = select_trades(scored, now_iso)
+        
+        log_predictions(self.db, predictions)
+        print(f"\n💾 Logged {len(predictions)} predictions")
         self._show_predictions(predictions)
         
         return predictions
     
-    async def _analyze_market(self, market: Dict, days_ahead: int) -> Optional[Dict]:
+    def _filter_market(self, market: Dict, days_ahead: int, now: datetime) -> Optional[str]:
         """
-        Analyze single market with AI.
-        Returns None if no trade, 'SKIPPED_DATE'/'SKIPPED_YEAR' if filtered.
+        Pre-prediction checks. `now` is the scan start time.
+        Returns 'SKIPPED_DATE'/'SKIPPED_YEAR' if filtered, 'SKIPPED_RANGE' if
+        too far out (not counted), or None if the market should be predicted.
         """
         question = market.get("question", "")
-        market_id = market.get("id", "")
         
         # Check end date is in the future and within range
         end_date = market.get("endDate") or market.get("event_end_date", "")
         if end_date:
             try:
-                end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00')).replace(tzinfo=timezone.utc)
-                now = datetime.now(timezone.utc)
-                
+                end_dt = parse_iso_z(end_date)
                 if end_dt < now:
                     print(f"    Skipping (ended {end_date[:10]}): {question[:40]}...")
                     return "SKIPPED_DATE"
                 
                 days_until = (end_dt - now).days
                 if days_until > days_ahead:
-                    return None  # Too far out, silently skip
+                    return "SKIPPED_RANGE"  # Too far out, silently skip
                     
             except:
                 pass
         
         # Check year in question isn't past
-        years_in_q = re.findall(r'20\d\d', question)
-        for year_str in years_in_q:
-            year = int(year_str)
-            if year < self.current_year:
-                print(f"    Skipping (year {year}): {question[:40]}...")
-                return "SKIPPED_YEAR"
-        
-        # Get current market odds
-        prices = market.get("prices", {})
-        yes_price = prices.get("yes", 0.5)
-        
-        try:
-            category = self._detect_category(question)
-            prediction = await self.predictor.predict(question, category)
-        except Exception as e:
-            print(f"Prediction failed: {e}")
-            return None
-        
-        our_prob = prediction.get("prob_yes", 0.5)
-        edge = abs(our_prob - yes_price)
-        confidence = prediction.get("confidence", 0)
-        
-        if edge < 0.10 or confidence < 0.65:
-            return None
-        
-        direction = "YES" if our_prob > yes_price else "NO"
-        trade_size = 10 + (confidence * 40)
-        
-        return {
-            "market_id": market_id,
-            "question": question,
-            "category": category,
-            "our_prediction": our_prob,
-            "market_odds": yes_price,
-            "direction": direction,
-            "confidence": confidence,
-            "edge": edge,
-            "sentiment_score": prediction.get("sentiment", 0),
-            "reasoning": prediction.get("reasoning", "")[:100],
-            "trade_size": round(trade_size, 2),
-            "open_time": datetime.now(timezone.utc).isoformat()
-        }
+        if "20" in question:
+            for year_str in _YEAR_RE.findall(question):
+                year = int(year_str)
+                if year < self.current_year:
+                    print(f"    Skipping (year {year}): {question[:40]}...")
+                    return "SKIPPED_YEAR"
+        
+        return None
     
     def _detect_category(self, question: str) -> str:
         """Detect market category"""
-        q = question.lower()
-        if any(word in q for word in ["bitcoin", "btc", "crypto", "ethereum"]):
-            return "crypto"
-        elif any(word in q for word in ["trump", "biden", "election", "senate"]):
-            return "politics"
-        elif any(word in q for word in ["super bowl", "nba", "nfl", "championship"]):
-            return "sports"
-        else:
-            return "other"
-    
-    def _log_predictions(self, predictions: List[Dict]):
-        """Log to database"""
-        cursor = self.db.cursor()
-        for p in predictions:
-            cursor.execute("""
-                INSERT INTO paper_predictions (
-                    market_id, question, category, our_prediction,
-                    market_odds, direction, confidence, edge,
-                    sentiment_score, reasoning, trade_size, open_time
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                p["market_id"], p["question"], p["category"],
-                p["our_prediction"], p["market_odds"], p["direction"],
-                p["confidence"], p["edge"], p["sentiment_score"],
-                p["reasoning"], p["trade_size"], p["open_time"]
-            ))
-        self.db.commit()
-        print(f"\n💾 Logged {len(predictions)} predictions")
+        return self._category_matcher.detect(question)
     
     def _show_predictions(self, predictions: List[Dict]):
         """Display predictions"""
@@ -1,77 +1,84 @@
 #!/usr/bin/env python3
 """
 Daily Paper Trader Scheduler
-Runs paper_trader.py once per day and logs results.
+Runs the paper trader once per day and logs results.
 """
 
 import asyncio
 import json
-import subprocess
-from datetime import datetime
+import logging
+import sys
 from pathlib import Path
-import sqlite3
+from typing import Optional
+
+from paper_trader import PaperTrader
 
 SCHEDULE_LOG = Path(__file__).parent / "data" / "scheduler.log"
-PAPER_DB = Path(__file__).parent / "data" / "paper_trades.sqlite"
 
-def log(message: str):
-    """Log with timestamp"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    line = f"[{timestamp}] {message}"
-    print(line)
-    
-    # Append to log file
+logger = logging.getLogger("scheduler")
+
+# Guard against a hung scan (seconds)
+RUN_TIMEOUT = 300
+
+# One trader per process, so a long-lived scheduler keeps its client/DB open
+_trader: Optional[PaperTrader] = None
+
+def get_trader() -> PaperTrader:
+    """Return the process-wide PaperTrader, creating it on first use"""
+    global _trader
+    if _trader is None:
+        _trader = PaperTrader()
+    return _trader
+
+def setup_logging():
+    """
+    Log to stdout (like the old print) and append to SCHEDULE_LOG through one held-open handler,
+    instead of reopening the file for every line.
+    """
     SCHEDULE_LOG.parent.mkdir(parents=True, exist_ok=True)
-    with open(SCHEDULE_LOG, "a") as f:
-        f.write(line + "\n")
+    formatter = logging.Formatter("[%(asctime)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+    
+    for handler in (logging.FileHandler(SCHEDULE_LOG, delay=True), logging.StreamHandler(sys.stdout)):
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
 
 async def run_paper_trader():
     """Execute paper trader and capture results"""
-    log("Starting paper trader run...")
+    logger.info("Starting paper trader run...")
     
     try:
-        # Run paper_trader.py
-        result = subprocess.run(
-            ["python3", str(Path(__file__).parent / "paper_trader.py")],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 min timeout
+        trader = get_trader()
+        predictions = await asyncio.wait_for(
+            trader.scan_and_predict(max_markets=100),
+            timeout=RUN_TIMEOUT
         )
-        
-        # Log output
-        if result.stdout:
-            log("Output:\n" + result.stdout[:2000])  # First 2000 chars
-        
-        if result.returncode != 0 and result.stderr:
-            log(f"Errors: {result.stderr[:500]}")
+        logger.info(f"Logged {len(predictions)} paper trades")
         
         # Get stats
         stats = await get_stats()
-        log(f"Total predictions: {stats['total']}")
-        log(f"Win rate: {stats['win_rate']:.1f}%" if stats['resolved'] > 0 else "No resolved yet")
+        logger.info(f"Total predictions: {stats['total']}")
+        logger.info(f"Win rate: {stats['win_rate']:.1f}%" if stats['resolved'] > 0 else "No resolved yet")
         
-        return result.returncode == 0
+        return True
         
-    except subprocess.TimeoutExpired:
-        log("ERROR: Paper trader timed out")
+    except asyncio.TimeoutError:
+        logger.error("ERROR: Paper trader timed out")
         return False
     except Exception as e:
-        log(f"ERROR: {e}")
+        logger.error(f"ERROR: {e}")
         return False
 
 async def get_stats():
-    """Get current stats from database"""
+    """Get current stats from database (reuses the trader's connection)"""
     try:
-        conn = sqlite3.connect(str(PAPER_DB))
-        cursor = conn.cursor()
-        cursor.execute("""
+        row = get_trader().db.execute("""
             SELECT 
                 COUNT(*) as total,
                 SUM(CASE WHEN outcome IS NOT NULL THEN 1 ELSE 0 END) as resolved,
                 SUM(CASE WHEN outcome='WIN' THEN 1 ELSE 0 END) as wins
             FROM paper_predictions
-        """)
-        row = cursor.fetchone()
+        """).fetchone()
         
         total, resolved, wins = row if row else (0, 0, 0)
         win_rate = (wins / max(resolved, 1) * 100) if resolved > 0 else 0
@@ -87,16 +94,22 @@ async def get_stats():
 
 async def main():
     """Main scheduler loop"""
-    log("="*60)
-    log("DAILY PAPER TRADER SCHEDULER")
-    log("="*60)
+    setup_logging()
+    
+    logger.info("="*60)
+    logger.info("DAILY PAPER TRADER SCHEDULER")
+    logger.info("="*60)
     
     # Run once now
-    await run_paper_trader()
+    try:
+        await run_paper_trader()
+    finally:
+        if _trader is not None:
+            await _trader.close()
     
-    log("Run complete. Set up cron for daily execution:")
-    log("  crontab -e")
-    log("  0 9 * * * cd /home/clawd/polymarket-bot && python3 scheduler.py")
+    logger.info("Run complete. Set up cron for daily execution:")
+    logger.info("  crontab -e")
+    logger.info("  0 9 * * * cd /home/clawd/polymarket-bot && python3 scheduler.py")
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -5,11 +5,23 @@ AI prediction engine for Polymarket markets.
 """
 
 import json
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
 from typing import Dict, Optional
 from utils.news_api import NewsFetcher
 from utils.sentiment import SentimentAnalyzer
 from utils.probability import BayesianCalculator
 
+CACHE_DB = Path(__file__).parent.parent / "data" / "prediction_cache.sqlite"
+
+# Seconds a prediction stays valid for an unchanged market
+CACHE_TTL = 3600
+
+# Drop expired in-memory entries once the dict grows past this many
+MEMORY_PRUNE_AT = 1024
+
 
 class MarketAnalyzer:
     """
@@ -21,11 +33,83 @@ class MarketAnalyzer:
         self.sentiment = SentimentAnalyzer()
         self.probability = BayesianCalculator()
         self.cache = {}
+        self.cache_db = self._init_cache_db()
+    
+    def _init_cache_db(self) -> sqlite3.Connection:
+        """Open the on-disk prediction cache shared across runs/processes"""
+        CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(CACHE_DB))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS prediction_cache (
+                market_id TEXT NOT NULL,
+                question_hash TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                ts REAL NOT NULL,
+                result TEXT NOT NULL,
+                PRIMARY KEY (market_id, question_hash, end_date)
+            )
+        """)
+        # Expired rows can never be served again - drop them on startup
+        conn.execute("DELETE FROM prediction_cache WHERE ts < ?", (time.time() - CACHE_TTL,))
+        conn.commit()
+        return conn
+    
+    @staticmethod
+    def _cache_key(market: Dict) -> tuple:
+        """(market_id, question hash, endDate) - a changed question or date is a new market"""
+        question = market.get("question", "")
+        return (
+            str(market.get("id", "")),
+            hashlib.sha1(question.encode()).hexdigest(),
+            market.get("endDate") or ""
+        )
+    
+    def _cache_get(self, key: tuple) -> Optional[Dict]:
+        """Fresh cached prediction from memory, then SQLite; None on miss"""
+        now = time.time()
+        
+        entry = self.cache.get(key)
+        if entry and now - entry["ts"] < CACHE_TTL:
+            return entry["result"]
+        
+        row = self.cache_db.execute(
+            "SELECT ts, result FROM prediction_cache "
+            "WHERE market_id = ? AND question_hash = ? AND end_date = ?",
+            key
+        ).fetchone()
+        if row and now - row[0] < CACHE_TTL:
+            result = json.loads(row[1])
+            self.cache[key] = {"ts": row[0], "result": result}
+            return result
+        
+        return None
+    
+    def _cache_put(self, key: tuple, result: Dict):
+        """Store a prediction in memory and SQLite"""
+        ts = time.time()
+        self.cache[key] = {"ts": ts, "result": result}
+        
+        # Keep the in-memory dict bounded in a long-running bot
+        if len(self.cache) > MEMORY_PRUNE_AT:
+            self.cache = {k: v for k, v in self.cache.items() if ts - v["ts"] < CACHE_TTL}
+        
+        with self.cache_db:
+            self.cache_db.execute(
+                "INSERT OR REPLACE INTO prediction_cache "
+                "(market_id, question_hash, end_date, ts, result) VALUES (?, ?, ?, ?, ?)",
+                (*key, ts, json.dumps(result))
+            )
     
-    async def analyze_market(self, market: Dict) -> Dict:
+    async def analyze_market(self, market: Dict, use_cache: bool = True) -> Dict:
         """
         Analyze a market and return prediction.
         
+        use_cache=False always recomputes (and refreshes the cache) - for
+        re-checking open positions, where a stale prediction would hide a
+        confidence drop.
+        
         Returns:
             {
                 "direction": "UP" or "DOWN",
@@ -35,9 +119,15 @@ class MarketAnalyzer:
                 "sources": list
             }
         """
-        market_id = market.get("id")
         question = market.get("question", "")
         
+        # Unchanged market seen within the TTL - skip news + sentiment work
+        key = self._cache_key(market)
+        if use_cache:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+        
         # Fetch relevant data
         news = await self.news_fetcher.fetch(question)
         
@@ -52,7 +142,7 @@ class MarketAnalyzer:
             news=news
         )
         
-        return {
+        result = {
             "direction": "YES" if prediction["prob_yes"] > 0.5 else "NO",
             "probability": prediction["prob_yes"],
             "confidence": prediction["confidence"],
@@ -60,6 +150,9 @@ class MarketAnalyzer:
             "sources": prediction["sources"],
             "sentiment": sentiment_score
         }
+        
+        self._cache_put(key, result)
+        return result
     
     def _analyze_politics(self, market: Dict) -> Dict:
         """Special handling for political markets."""
@@ -6,8 +6,14 @@ Shows how the bot would analyze a Polymarket market using real search.
 
 import asyncio
 import json
+import re
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from utils.constants import STOP_RE
+from utils.jit import njit
 
 # Sample markets to test
 SAMPLE_MARKETS = [
@@ -19,11 +25,13 @@ SAMPLE_MARKETS = [
     }
 ]
 
+# Whole-word, case-insensitive lexicons - one regex pass per polarity
+_POS_RE = re.compile(r"\b(?:bull|bullish|rally|surge|strong|growth|ATH|confident)\b", re.I)
+_NEG_RE = re.compile(r"\b(?:bear|bearish|crash|dump|fall|weak|correction)\b", re.I)
+
 def build_search_query(question: str, category: str) -> str:
     """Convert market question to search query."""
-    query = question.lower()
-    for word in ["will", "by", "the", "in", "on", "if", "?"]:
-        query = query.replace(word, " ")
+    query = " ".join(STOP_RE.sub(" ", question.lower()).split())
     
     context = {
         "crypto": "price prediction analysis forecast latest 2026",
@@ -34,20 +42,29 @@ def build_search_query(question: str, category: str) -> str:
     
     return query.strip()
 
-def analyze_sentiment(text: str) -> float:
-    """Simple sentiment analysis: -1.0 to +1.0"""
-    text = text.lower()
-    positive_words = ["bull", "bullish", "rally", "surge", "strong", "growth", " ATH", "confident"]
-    negative_words = ["bear", "bearish", "crash", "dump", "fall", "weak", "correction"]
-    
-    pos_count = sum(1 for word in positive_words if word in text)
-    neg_count = sum(1 for word in negative_words if word in text)
-    
-    total = pos_count + neg_count
-    if total == 0:
-        return 0.0
+def sentiment_counts(text: str) -> Tuple[int, int]:
+    """(positive, negative) lexicon hits in text"""
+    return len(_POS_RE.findall(text)), len(_NEG_RE.findall(text))
+
+@njit(cache=True, fastmath=True)
+def _predict_from_counts(pos, neg, current_odds):
+    """
+    Numeric core of calculate_probability.
+    pos/neg are per-signal lexicon hit counts (int64 arrays, one entry per
+    title/snippet). Returns (prob_yes, confidence, avg_sentiment).
+    """
+    total_sentiment = 0.0
+    for i in range(pos.shape[0]):
+        total = pos[i] + neg[i]
+        if total > 0:
+            total_sentiment += (pos[i] - neg[i]) / total
+    
+    avg_sentiment = total_sentiment / pos.shape[0]
+    predicted_prob = current_odds + avg_sentiment * 0.3
+    predicted_prob = max(0.05, min(0.95, predicted_prob))
     
-    return (pos_count - neg_count) / total
+    confidence = min(0.5 + abs(avg_sentiment) * 0.3, 0.9)
+    return predicted_prob, confidence, avg_sentiment
 
 def calculate_probability(results: List[Dict], current_odds: float) -> Dict:
     """Calculate prediction from search results."""
@@ -60,17 +77,17 @@ def calculate_probability(results: List[Dict], current_odds: float) -> Dict:
             "sentiment": 0.0
         }
     
-    total_sentiment = 0
-    for result in results[:3]:
-        text = f"{result.get('title', '')} {result.get('snippet', '')}"
-        total_sentiment += analyze_sentiment(text)
-    
-    avg_sentiment = total_sentiment / 3
-    prob_adjustment = avg_sentiment * 0.3
-    predicted_prob = current_odds + prob_adjustment
-    predicted_prob = max(0.05, min(0.95, predicted_prob))
+    # String scanning stays in Python; the math runs in the JIT'd core.
+    # Title and snippet are scored as separate signals - no concatenation
+    counts = [
+        sentiment_counts(result.get(field, ""))
+        for result in results[:3]
+        for field in ("title", "snippet")
+    ]
+    pos = np.array([c[0] for c in counts], dtype=np.int64)
+    neg = np.array([c[1] for c in counts], dtype=np.int64)
     
-    confidence = min(0.5 + (abs(avg_sentiment) * 0.3), 0.9)
+    predicted_prob, confidence, avg_sentiment = _predict_from_counts(pos, neg, float(current_odds))
     direction = "YES" if predicted_prob > current_odds else "NO"
     
     return {
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Category Matcher
+Keyword-based market categorisation in a single pass over the question.
+"""
+
+import re
+from typing import Dict, Iterable
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
+
+
+class CategoryMatcher:
+    """
+    Map a market question to the first category whose keywords it contains.
+
+    Categories are given in priority order. All keywords go into one
+    Aho-Corasick automaton, so the question is scanned once no matter how
+    large the vocabulary grows; when several categories hit, the earliest
+    one wins, same as an if/elif chain. Without pyahocorasick installed it
+    falls back to a single compiled alternation over the same keywords.
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]], default: str = "other"):
+        self.default = default
+        self._automaton = None
+        self._pattern = None
+        self._prefix_best = {}
+
+        # keyword -> (priority rank, category); a keyword shared by two
+        # categories belongs to the higher-priority one
+        self._words = {}
+        for rank, (category, words) in enumerate(categories.items()):
+            for word in words:
+                self._words.setdefault(word.lower(), (rank, category))
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for word, value in self._words.items():
+                self._automaton.add_word(word, value)
+            self._automaton.make_automaton()
+        else:
+            # Zero-width lookahead so every start position is tried and
+            # overlapping keywords ("game" inside "gamelon" vs "elon") are
+            # all seen. Longest first, so a start position reports its
+            # longest keyword...
+            ordered = sorted(self._words, key=len, reverse=True)
+            self._pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+            # ...and any shorter keyword matching at the same position is a
+            # prefix of it, so fold the best-ranked prefix into each entry
+            self._prefix_best = {
+                word: min(value for other, value in self._words.items() if word.startswith(other))
+                for word in self._words
+            }
+
+    def _hits(self, text: str):
+        """Yield (rank, category) for each keyword occurrence in lowercased text."""
+        if self._automaton is not None:
+            for _, value in self._automaton.iter(text):
+                yield value
+        else:
+            for m in self._pattern.finditer(text):
+                yield self._prefix_best[m.group(1)]
+
+    def detect(self, question: str) -> str:
+        """Return the category for a question, or the default if nothing matches."""
+        best = None
+        for rank, category in self._hits(question.lower()):
+            # Nothing can outrank the first category - stop scanning
+            if rank == 0:
+                return category
+            if best is None or rank < best[0]:
+                best = (rank, category)
+
+        return best[1] if best else self.default
+
+
+if __name__ == "__main__":
+    # Regression: overlapping keywords must not hide a higher-priority hit
+    matcher = CategoryMatcher({
+        "politics": ["elon", "trump"],
+        "sports": ["game", "nba", "nba finals"],
+        "gaming": ["gamelon"],
+    })
+    assert matcher.detect("Will the gamelon launch?") == "politics"
+    assert matcher.detect("NBA Finals winner?") == "sports"
+    assert matcher.detect("Gamelon sales?") == "politics"
+    assert matcher.detect("Nothing here") == "other"
+    # A shorter, higher-priority keyword at the same start position still wins
+    assert CategoryMatcher({"a": ["nba"], "b": ["nba finals"]}).detect("nba finals") == "a"
+    print("CategoryMatcher OK")
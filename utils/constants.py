@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Shared constants
+API hosts and keyword vocabularies used across the market scripts.
+"""
+
+import re
+
+GAMMA_HOST = "https://gamma-api.polymarket.com"
+
+# Search-query noise: stopwords (whole words only) and stray symbols,
+# stripped from market questions in one pass
+STOP_RE = re.compile(r"\b(?:will|by|the|in|on|if)\b|[?$%]", re.IGNORECASE)
+
+# Leagues, teams, sports and esports titles that mark a market as sports
+SPORTS_KEYWORDS = frozenset({
+    # leagues / competitions
+    "nba", "nfl", "nhl", "mlb", "ufc", "atp", "wta", "uefa", "epl",
+    "la liga", "bundesliga", "champions", "championship", "playoff",
+    "super bowl", "world cup",
+    # sports
+    "soccer", "football", "basketball", "baseball", "hockey", "tennis",
+    # nba teams
+    "bulls", "lakers", "celtics", "warriors", "knicks", "pacers", "bucks",
+    "heat", "magic", "suns", "thunder", "nuggets", "timberwolves",
+    # esports
+    "lol", "valorant", "dota", "cs2",
+})
+
+
+def keyword_re(words) -> "re.Pattern":
+    """
+    Case-insensitive, word-bounded alternation over `words` that also
+    accepts plurals ("playoffs", "championships", "matches"), as the old
+    substring checks did. Longest first so multi-word keywords win over
+    their prefixes.
+    """
+    ordered = sorted(words, key=len, reverse=True)
+    return re.compile(r"\b(" + "|".join(map(re.escape, ordered)) + r")(?:e?s)?\b", re.IGNORECASE)
+
+
+SPORTS_RE = keyword_re(SPORTS_KEYWORDS)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+File Cache
+TTL cache for JSON-serialisable data, persisted as one file per key.
+"""
+
+import os
+import json
+import time
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional - stdlib json decodes the same data
+    import json as _json
+
+
+class FileCache:
+    """
+    An in-memory LRU in front of one `{key}.json` file per entry, so hits
+    survive across processes and repeated in-process hits skip the file
+    read and JSON decode.
+
+    Expired files are deleted when a lookup finds them stale, and after
+    each write the directory is trimmed to `max_size_mb` by deleting the
+    least recently used files (oldest mtime; hits bump the mtime).
+    """
+
+    def __init__(self, directory: Path, max_memory: int = 256, max_size_mb: float = 50):
+        self.directory = directory
+        self.max_memory = max_memory
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict] = None) -> str:
+        """Stable key for an endpoint + query params"""
+        raw = endpoint + json.dumps(sorted((params or {}).items()), default=str)
+        return hashlib.md5(raw.encode()).hexdigest()
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """Cached data if younger than `ttl` seconds, else None"""
+        now = time.time()
+        path = self.directory / f"{key}.json"
+
+        entry = self._memory.get(key)
+        from_disk = entry is None
+        if from_disk:
+            try:
+                stored = _json.loads(path.read_bytes())
+                entry = (stored["t"], stored["data"])
+            except (OSError, ValueError, KeyError):
+                return None
+
+        if now - entry[0] >= ttl:
+            # Stale - it can never be served again, so don't keep it around
+            self._memory.pop(key, None)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        if from_disk:
+            self._remember(key, entry)
+            try:
+                os.utime(path)  # bump mtime so eviction is least-recently-used
+            except OSError:
+                pass
+        else:
+            self._memory.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: str, data: Any):
+        """Store data under key, in memory and on disk, then enforce the size cap"""
+        t = time.time()
+        self._remember(key, (t, data))
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = self.directory / f"{key}.json.tmp"
+            with open(tmp, "w") as f:
+                json.dump({"t": t, "data": data}, f)
+            os.replace(tmp, self.directory / f"{key}.json")
+            self._evict()
+        except OSError as e:
+            print(f"Cache write failed: {e}")
+
+    def _remember(self, key: str, entry: tuple):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_memory:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        """Delete least-recently-used files (oldest mtime) until under max_size_bytes"""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+
+        if total <= self.max_size_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_size_bytes:
+                break
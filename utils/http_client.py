@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session
+One pooled aiohttp session with keep-alive, reused by every script.
+"""
+
+from typing import Any, Dict, Optional
+
+import aiohttp
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional - stdlib json decodes the same data
+    import json as _json
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Return the process-wide aiohttp session, creating it on first use.
+
+    Must be called from inside a running event loop.
+    """
+    global _session
+
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=15)
+        )
+    return _session
+
+
+async def fetch_json(session: aiohttp.ClientSession, url: str, params: Optional[Dict] = None) -> Any:
+    """
+    GET `url` and decode the JSON body (orjson when installed).
+
+    The raw bytes go straight to loads, which skips the charset sniffing
+    and bytes->str copy that `await r.json()` does first.
+    """
+    async with session.get(url, params=params) as r:
+        r.raise_for_status()
+        return _json.loads(await r.read())
+
+
+async def close_session():
+    """Close the shared session (call once before the event loop exits)."""
+    global _session
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+JIT helper
+`njit` from numba when it is installed, otherwise a no-op decorator so the
+decorated NumPy/Python code runs unchanged.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+__all__ = ["njit"]
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Market Cache
+On-disk cache for gamma-api /markets responses, shared across scripts.
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+import aiohttp
+
+from utils.constants import GAMMA_HOST
+from utils.file_cache import FileCache
+from utils.http_client import fetch_json
+
+# Same directory and key scheme as PolymarketClient, so a list fetched by
+# the bot is a hit for the scanning scripts and vice versa
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "polymarket"
+
+_CACHE = FileCache(CACHE_DIR)
+
+
+async def get_markets_cached(session: aiohttp.ClientSession, params: Dict, ttl: float = 60) -> List[Dict]:
+    """
+    Fetch /markets with the given query params, reusing a response that is
+    less than `ttl` seconds old - including one written by an earlier run,
+    since each scanning script is its own short-lived process.
+    """
+    key = FileCache.key("/markets", params)
+
+    cached = _CACHE.get(key, ttl)
+    if cached is not None:
+        return cached
+
+    data = await fetch_json(session, f"{GAMMA_HOST}/markets", params)
+    _CACHE.set(key, data)
+    return data
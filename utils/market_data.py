@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Market Data
+Column (struct-of-arrays) view over gamma-api market dicts.
+"""
+
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Dict, List
+
+import numpy as np
+
+# Shared read-only default so `m.get("prices") or _EMPTY` never allocates
+_EMPTY = MappingProxyType({})
+
+
+def _to_float(value) -> float:
+    """float() that treats missing/garbage API values as 0"""
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def to_epoch(iso: str) -> int:
+    """
+    ISO8601 date/datetime -> integer UTC epoch seconds.
+    Naive values (e.g. a bare "2026-03-31") are taken as UTC.
+    Raises ValueError on malformed input.
+    """
+    dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def project(markets: List[Dict]) -> Dict:
+    """
+    Project a list of market dicts into parallel columns.
+
+    Returns:
+        {
+            "question": list of str,
+            "end": list of raw endDate str ("" when missing),
+            "volume": float64 array (USDC),
+            "yes": float64 array (YES price, 0.0 to 1.0)
+        }
+    """
+    n = len(markets)
+    return {
+        "question": [m.get("question") or "" for m in markets],
+        "end": [m.get("endDate") or "" for m in markets],
+        "volume": np.fromiter((_to_float(m.get("volume")) for m in markets), dtype=np.float64, count=n),
+        "yes": np.fromiter(
+            (_to_float((m.get("prices") or _EMPTY).get("yes")) for m in markets),
+            dtype=np.float64, count=n
+        ),
+    }
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Paper Trading Store
+Database, end-date parsing and trade selection shared by both paper traders.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+# 80 rows x 12 columns = 960 bound parameters, under SQLite's 999 default cap
+ROWS_PER_INSERT = 80
+
+_INSERT_PREFIX = """
+    INSERT INTO paper_predictions (
+        market_id, question, category, our_prediction,
+        market_odds, direction, confidence, edge,
+        sentiment_score, reasoning, trade_size, open_time
+    ) VALUES """
+_PLACEHOLDER = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+# Built once at import so every call hands sqlite3 the same string objects
+# and hits its statement cache
+_INSERT_SQL = _INSERT_PREFIX + _PLACEHOLDER
+_INSERT_BATCH_SQL = _INSERT_PREFIX + ", ".join([_PLACEHOLDER] * ROWS_PER_INSERT)
+
+
+def parse_iso_z(s: str) -> datetime:
+    """
+    Parse an end date, fast-pathing Polymarket's fixed `YYYY-MM-DDTHH:MM:SSZ`
+    shape by slicing. Anything else goes through fromisoformat.
+    """
+    if len(s) == 20 and s[19] == "Z":
+        try:
+            return datetime(
+                int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                tzinfo=timezone.utc
+            )
+        except ValueError:
+            pass
+    return datetime.fromisoformat(s.replace('Z', '+00:00')).replace(tzinfo=timezone.utc)
+
+
+def open_paper_db(path: Path) -> sqlite3.Connection:
+    """Open (and create if needed) the paper trading database"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(path), cached_statements=256)
+
+    # WAL + synchronous=NORMAL: no fsync per commit, still crash-safe
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS paper_predictions (
+            id INTEGER PRIMARY KEY,
+            market_id TEXT NOT NULL,
+            question TEXT,
+            category TEXT,
+            our_prediction REAL,
+            market_odds REAL,
+            direction TEXT,
+            confidence REAL,
+            edge REAL,
+            sentiment_score REAL,
+            reasoning TEXT,
+            trade_size REAL,
+            open_time TEXT,
+            resolve_time TEXT,
+            outcome TEXT,
+            resolved_value REAL,
+            pnl REAL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Partial index covers get_stats' resolved-only aggregates; market_id
+    # serves resolve-time lookups
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_pp_outcome "
+        "ON paper_predictions(outcome) WHERE outcome IS NOT NULL"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_pp_market_id ON paper_predictions(market_id)")
+
+    conn.commit()
+    return conn
+
+
+def select_trades(scored: List[tuple], now_iso: str) -> List[Dict]:
+    """
+    Turn (market, question, category, prediction) tuples into paper trades.
+    Edge/confidence thresholds and trade sizes are evaluated for the whole
+    scan at once; markets without enough edge are dropped.
+    """
+    if not scored:
+        return []
+
+    n = len(scored)
+    our_prob = np.fromiter((s[3].get("prob_yes", 0.5) for s in scored), dtype=np.float64, count=n)
+    yes_price = np.fromiter(
+        (s[0].get("prices", {}).get("yes", 0.5) for s in scored), dtype=np.float64, count=n
+    )
+    confidence = np.fromiter((s[3].get("confidence", 0) for s in scored), dtype=np.float64, count=n)
+
+    edge = np.abs(our_prob - yes_price)
+    mask = (edge >= 0.10) & (confidence >= 0.65)
+    trade_size = np.round(10 + confidence * 40, 2)
+
+    trades = []
+    for i in np.flatnonzero(mask).tolist():
+        market, question, category, prediction = scored[i]
+        trades.append({
+            "market_id": market.get("id", ""),
+            "question": question,
+            "category": category,
+            "our_prediction": prediction.get("prob_yes", 0.5),
+            "market_odds": market.get("prices", {}).get("yes", 0.5),
+            "direction": "YES" if our_prob[i] > yes_price[i] else "NO",
+            "confidence": prediction.get("confidence", 0),
+            "edge": float(edge[i]),
+            "sentiment_score": prediction.get("sentiment", 0),
+            "reasoning": prediction.get("reasoning", "")[:100],
+            "trade_size": float(trade_size[i]),
+            "open_time": now_iso
+        })
+
+    return trades
+
+
+def log_predictions(db: sqlite3.Connection, predictions: List[Dict]):
+    """Insert paper trades in one transaction"""
+    rows = [
+        (
+            p["market_id"], p["question"], p["category"],
+            p["our_prediction"], p["market_odds"], p["direction"],
+            p["confidence"], p["edge"], p["sentiment_score"],
+            p["reasoning"], p["trade_size"], p["open_time"]
+        )
+        for p in predictions
+    ]
+
+    full = len(rows) - len(rows) % ROWS_PER_INSERT
+
+    # One transaction for the whole batch; commits on success, rolls back on error
+    with db:
+        # Full chunks: one multi-row INSERT each, so SQLite parses/plans once per 80 rows
+        for start in range(0, full, ROWS_PER_INSERT):
+            chunk = rows[start:start + ROWS_PER_INSERT]
+            db.execute(_INSERT_BATCH_SQL, [v for row in chunk for v in row])
+
+        # Leftovers: reuse the single-row statement
+        if full < len(rows):
+            db.executemany(_INSERT_SQL, rows[full:])
@@ -5,23 +5,57 @@ Official SDK wrapper for trading.
 """
 
 import os
-import json
+import re
+import time
 import asyncio
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Pattern
 from dataclasses import dataclass
 from pathlib import Path
 
-# Load environment variables from .env file
+import httpx
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional - stdlib json decodes the same data
+    import json as _json
+
+from utils.file_cache import FileCache
+
+try:
+    from py_clob_client.order_builder.constants import BUY, SELL
+except ImportError:  # trading SDK is optional for read-only use
+    BUY = SELL = None
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # python-dotenv is optional
+    load_dotenv = None
+
+# [export] KEY=value; comments and blank lines don't match
+_ENV_RE = re.compile(r"^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$", re.M)
+
+
+def _unquote(value: str) -> str:
+    """Strip one matching pair of surrounding quotes"""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+# Load environment variables from .env file (existing env vars win)
 env_path = Path(__file__).parent.parent / ".env"
 if env_path.exists():
-    with open(env_path) as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                # Remove quotes if present
-                value = value.strip('"').strip("'")
-                os.environ.setdefault(key, value)
+    if load_dotenv is not None:
+        load_dotenv(env_path, override=False)
+    else:
+        for key, value in _ENV_RE.findall(env_path.read_text()):
+            os.environ.setdefault(key, _unquote(value))
+
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "polymarket"
+
+# Seconds a cached gamma response stays fresh
+LIST_TTL = 60      # /events, /markets
+MARKET_TTL = 300   # /markets/{id}
+INDEX_TTL = 60     # get_market's id/slug index
 
 
 @dataclass
@@ -43,20 +77,56 @@ class PolymarketClient:
     4. Trade
     """
     
+    # py_clob_client.ClobClient, imported lazily by connect()
+    _ClobClient = None
+    
     def __init__(self):
         self.client = None
         self.creds = None
         self.host = "https://clob.polymarket.com"
         self.gamma_host = "https://gamma-api.polymarket.com"
         self.chain_id = 137  # Polygon
+        self._http: Optional[httpx.AsyncClient] = None
+        # Caps in-flight per-market requests in get_markets_bulk
+        self._sem = asyncio.Semaphore(16)
+        self.cache = FileCache(CACHE_DIR)
+        # id/slug -> market over the active list, rebuilt at most every INDEX_TTL
+        self._market_index: Dict[str, Dict] = {}
+        self._index_expires: float = 0
+        self._index_lock = asyncio.Lock()
         
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Pooled gamma-api client, created on first use and reused for every call"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.gamma_host,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=10.0
+            )
+        return self._http
+    
+    async def close(self):
+        """Close the pooled HTTP client"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    @classmethod
+    def _clob_class(cls):
+        """Import ClobClient on first use and keep it on the class"""
+        if cls._ClobClient is None:
+            from py_clob_client.client import ClobClient
+            cls._ClobClient = ClobClient
+        return cls._ClobClient
+    
     async def connect(self) -> bool:
         """
         Initialize connection to Polymarket.
         Requires PRIVATE_KEY in environment.
         """
         try:
-            from py_clob_client.client import ClobClient
+            ClobClient = self._clob_class()
             
             private_key = os.getenv("POLYMARKET_PRIVATE_KEY")
             if not private_key:
@@ -96,61 +166,144 @@ class PolymarketClient:
         
         Returns list of events with nested markets.
         """
-        import requests
+        params = {"active": str(active).lower(), "closed": "false", "limit": limit}
+        key = FileCache.key("/events", params)
+        cached = self.cache.get(key, ttl=LIST_TTL)
+        if cached is not None:
+            return cached
         
         try:
-            response = requests.get(
-                f"{self.gamma_host}/events",
-                params={"active": str(active).lower(), "closed": "false", "limit": limit},
-                timeout=10
-            )
+            response = await self.http.get("/events", params=params)
             response.raise_for_status()
-            return response.json()
+            events = _json.loads(response.content)
+            self.cache.set(key, events)
+            return events
         except Exception as e:
             print(f"Failed to fetch events: {e}")
             return []
     
-    async def get_markets(self, active: bool = True, limit: int = 10) -> List[Dict]:
+    async def get_markets(
+        self,
+        active: bool = True,
+        limit: int = 10,
+        query: Optional[str] = None,
+        match: Optional[Pattern[bytes]] = None,
+        end_date_min: Optional[str] = None,
+        order: Optional[str] = None,
+        ascending: bool = True
+    ) -> List[Dict]:
         """
         DEPRECATED: Use get_events() instead.
         Fetch active markets (may return stale data).
+        
+        Args:
+            query: Optional text search, forwarded to gamma as `q` so the
+                   server can narrow the payload. Callers should still
+                   filter locally in case it is ignored.
+            match: Optional bytes regex run over the raw response body.
+                   If it finds nothing, the JSON is never decoded and []
+                   is returned. Cache hits skip this check.
+            end_date_min: Optional ISO8601 timestamp; gamma drops markets
+                   ending before it, so already-ended rows never arrive.
+            order: Optional field for gamma to sort by (e.g. "volume"),
+                   in `ascending` order.
         """
-        import requests
+        params = {"active": str(active).lower(), "closed": "false", "limit": limit}
+        if query:
+            params["q"] = query
+        if end_date_min:
+            params["end_date_min"] = end_date_min
+        if order:
+            params["order"] = order
+            params["ascending"] = str(ascending).lower()
+        
+        key = FileCache.key("/markets", params)
+        cached = self.cache.get(key, ttl=LIST_TTL)
+        if cached is not None:
+            return cached
         
         try:
-            response = requests.get(
-                f"{self.gamma_host}/markets",
-                params={"active": str(active).lower(), "closed": "false", "limit": limit},
-                timeout=10
-            )
+            response = await self.http.get("/markets", params=params)
             response.raise_for_status()
-            return response.json()
+            if match is not None and not match.search(response.content):
+                return []
+            markets = _json.loads(response.content)
+            self.cache.set(key, markets)
+            return markets
         except Exception as e:
             print(f"Failed to fetch markets: {e}")
             return []
     
-    async def get_market(self, market_id: str) -> Optional[Dict]:
-        """Get specific market by ID or slug"""
-        import requests
-        
-        try:
-            # Try by slug first
-            response = requests.get(
-                f"{self.gamma_host}/markets/{market_id}",
-                timeout=10
-            )
-            if response.status_code == 200:
-                return response.json()
+    async def _ensure_index(self):
+        """(Re)build the id/slug -> market index if it is older than INDEX_TTL"""
+        async with self._index_lock:
+            if time.monotonic() < self._index_expires:
+                return
             
-            # Fallback: search in active markets
             markets = await self.get_markets(active=True, limit=100)
+            index = {}
             for m in markets:
-                if m.get("market_slug") == market_id or m.get("id") == market_id:
-                    return m
-            return None
-        except Exception as e:
-            print(f"Failed to get market: {e}")
-            return None
+                for key in (m.get("id"), m.get("market_slug"), m.get("slug")):
+                    if key:
+                        index[str(key)] = m
+            
+            self._market_index = index
+            self._index_expires = time.monotonic() + INDEX_TTL
+    
+    async def _fetch_one(self, market_id: str, use_cache: bool = True) -> Optional[Dict]:
+        """
+        Fetch one market by ID. Any 4xx means "not an ID" and falls back to
+        the slug index / slug query. Raises on 5xx and transport errors;
+        returns None if nothing matches.
+        """
+        key = FileCache.key(f"/markets/{market_id}")
+        if use_cache:
+            cached = self.cache.get(key, ttl=MARKET_TTL)
+            if cached is not None:
+                return cached
+        
+        async with self._sem:
+            response = await self.http.get(f"/markets/{market_id}")
+            if not 400 <= response.status_code < 500:
+                response.raise_for_status()
+                market = _json.loads(response.content)
+            else:
+                # Not an ID - try the active-market index, then ask gamma for the slug
+                await self._ensure_index()
+                market = self._market_index.get(market_id)
+                if market is None:
+                    response = await self.http.get("/markets", params={"slug": market_id})
+                    response.raise_for_status()
+                    markets = _json.loads(response.content)
+                    market = markets[0] if markets else None
+        
+        if market is not None:
+            self.cache.set(key, market)
+        return market
+    
+    async def get_markets_bulk(self, ids: List[str], use_cache: bool = True) -> List[Optional[Dict]]:
+        """
+        Fetch many markets by ID or slug concurrently (at most 16 in flight).
+        Results line up with `ids`; failed lookups come back as None.
+        use_cache=False always hits the API (the result still refreshes the
+        cache) - for position refreshes that must see `resolved` promptly.
+        """
+        results = await asyncio.gather(
+            *(self._fetch_one(market_id, use_cache) for market_id in ids),
+            return_exceptions=True
+        )
+        
+        markets = []
+        for market_id, result in zip(ids, results):
+            if isinstance(result, Exception):
+                print(f"Failed to get market {market_id}: {result}")
+                result = None
+            markets.append(result)
+        return markets
+    
+    async def get_market(self, market_id: str) -> Optional[Dict]:
+        """Get specific market by ID or slug"""
+        return (await self.get_markets_bulk([market_id]))[0]
     
     async def get_order_book(self, token_id: str) -> Dict:
         """
@@ -162,7 +315,7 @@ class PolymarketClient:
             raise RuntimeError("Not connected")
         
         try:
-            return self.client.get_order_book(token_id)
+            return await asyncio.to_thread(self.client.get_order_book, token_id)
         except Exception as e:
             print(f"Failed to get order book: {e}")
             return {}
@@ -173,7 +326,7 @@ class PolymarketClient:
             raise RuntimeError("Not connected")
         
         try:
-            return self.client.get_balance()
+            return await asyncio.to_thread(self.client.get_balance)
         except Exception as e:
             print(f"Failed to get balance: {e}")
             return {"balance": 0}
@@ -198,7 +351,8 @@ class PolymarketClient:
             raise RuntimeError("Not connected")
         
         try:
-            from py_clob_client.order_builder.constants import BUY, SELL
+            if BUY is None:
+                raise ImportError("py_clob_client is not installed")
             
             side_enum = BUY if side.upper() == "BUY" else SELL
             
@@ -210,14 +364,16 @@ class PolymarketClient:
                 else:
                     price = float(ob.get("bids", [[0, 1]])[0][0]) if ob.get("bids") else 0.5
             
-            order = self.client.create_order(
+            # py_clob_client is synchronous - keep signing/posting off the event loop
+            order = await asyncio.to_thread(
+                self.client.create_order,
                 token_id=token_id,
                 side=side_enum,
                 price=price,
                 size=size
             )
             
-            response = self.client.post_order(order)
+            response = await asyncio.to_thread(self.client.post_order, order)
             print(f"Order placed: {response}")
             return response
             
@@ -231,7 +387,7 @@ class PolymarketClient:
             raise RuntimeError("Not connected")
         
         try:
-            self.client.cancel(order_id)
+            await asyncio.to_thread(self.client.cancel, order_id)
             return True
         except Exception as e:
             print(f"Failed to cancel order: {e}")
@@ -243,28 +399,38 @@ class PolymarketClient:
             raise RuntimeError("Not connected")
         
         try:
-            return self.client.get_orders()
+            return await asyncio.to_thread(self.client.get_orders)
         except Exception as e:
             print(f"Failed to get orders: {e}")
             return []
     
     def get_token_id(self, market: Dict, outcome: str) -> Optional[str]:
         """
-        Get token ID for YES or NO outcome.
+        Get token ID for an outcome (YES/NO on binary markets).
         
         Args:
             market: Market dict from get_markets
-            outcome: "YES" or "NO"
+            outcome: Outcome name, e.g. "YES"/"NO" (case-insensitive)
         
         Returns:
-            Token ID string
+            Token ID string, or None if the market has no such outcome.
+            The outcome->token mapping is cached on the market dict.
         """
-        token_ids = market.get("clobTokenIds", [])
-        if len(token_ids) < 2:
-            return None
+        mapping = market.get("_token_map")
+        if mapping is None:
+            outcomes = market.get("outcomes") or ["Yes", "No"]
+            token_ids = market.get("clobTokenIds") or []
+            # gamma often sends these as JSON-encoded strings
+            if isinstance(outcomes, str):
+                outcomes = _json.loads(outcomes)
+            if isinstance(token_ids, str):
+                token_ids = _json.loads(token_ids)
+            
+            # Pair by position in the market's own outcome order
+            mapping = dict(zip((o.upper() for o in outcomes), token_ids))
+            market["_token_map"] = mapping
         
-        # Index 0 = YES, Index 1 = NO
-        return token_ids[0] if outcome.upper() == "YES" else token_ids[1]
+        return mapping.get(outcome.upper())
 
 
 # Test function
@@ -273,7 +439,10 @@ async def test_client():
     client = PolymarketClient()
     
     print("Testing public market fetch...")
-    markets = await client.get_markets(active=True, limit=3)
+    try:
+        markets = await client.get_markets(active=True, limit=3)
+    finally:
+        await client.close()
     
     if markets:
         print(f"✅ Found {len(markets)} active markets")
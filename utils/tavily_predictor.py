@@ -1,18 +1,62 @@
 #!/usr/bin/env python3
-"""Web-based Prediction EngineUses Tavily for deep research via skill script."""
+"""Web-based Prediction EngineUses Tavily for deep research via the Tavily REST API."""
 
+import os
 import json
-import subprocess
+import time
+import asyncio
+import hashlib
+import contextlib
 import re
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional - stdlib json decodes the same data
+    import json as _json
+
+from utils.constants import STOP_RE
+
+TAVILY_URL = "https://api.tavily.com/search"
+
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "tavily"
+CACHE_TTL = 3600  # seconds
+
+
+BULLISH_WORDS = ["bull", "bullish", "rally", "surge", "moon", "strong", "higher",
+                 "growth", "confident", "expected", "likely", "yes", "reach",
+                 "target", "predict", "forecast"]
+BEARISH_WORDS = ["bear", "bearish", "crash", "dump", "fall", "lower", "weak",
+                 "unlikely", "doubt", "correction", "no"]
+
+# One case-insensitive, word-bounded pass over the text per polarity
+_BULL_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, BULLISH_WORDS)) + r")\b", re.I)
+_BEAR_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, BEARISH_WORDS)) + r")\b", re.I)
 
 
 class WebPredictor:
     """Search web and make predictions."""
     
-    def __init__(self):
+    def __init__(self, max_size_mb: float = 50):
         self.cache = {}
-        self.skill_dir = "/home/clawd/.openclaw/workspace/skills/tavily-search"
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._client: Optional[httpx.AsyncClient] = None
+        
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Pooled Tavily client, created on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=30.0)
+        return self._client
+    
+    async def close(self):
+        """Close the pooled HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         
     async def predict(self, market_question: str, category: str) -> Dict:
         """Make prediction using Tavily."""
@@ -20,35 +64,122 @@ class WebPredictor:
         if cache_key in self.cache:
             return self.cache[cache_key]
         
+        # Survives restarts - a fresh on-disk result skips the search entirely
+        path = CACHE_DIR / f"{hashlib.sha1(cache_key.encode()).hexdigest()}.json"
+        prediction = self._disk_get(path)
+        if prediction is not None:
+            self.cache[cache_key] = prediction
+            return prediction
+        
         query = self._build_query(market_question, category)
         
         # Call Tavily
-        result = self._search(query)
+        result = await self._search(query)
         
         # Parse results
         prediction = self._parse_results(result, market_question)
         self.cache[cache_key] = prediction
+        if result:
+            self._disk_set(path, prediction)
         return prediction
         
-    def _search(self, query: str) -> str:
-        """Run Tavily search."""
+    def _disk_get(self, path: Path) -> Optional[Dict]:
+        """Cached prediction at path if younger than CACHE_TTL, else None"""
         try:
-            result = subprocess.run(
-                ["node", f"{self.skill_dir}/scripts/search.mjs", query, "--deep", "-n", "5"],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            return result.stdout if result.returncode == 0 else ""
+            entry = _json.loads(path.read_bytes())
+            if time.time() - entry["t"] < CACHE_TTL:
+                os.utime(path)  # bump mtime so eviction is least-recently-used
+                return entry["data"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return None
+    
+    def _disk_set(self, path: Path, prediction: Dict):
+        """Write a prediction to the disk cache, then enforce the size cap"""
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump({"t": time.time(), "data": prediction}, f)
+            os.replace(tmp, path)
+            self._evict()
+        except OSError as e:
+            print(f"Cache write failed: {e}")
+    
+    def _evict(self):
+        """Delete least-recently-used entries (oldest mtime) until under max_size_bytes"""
+        entries = []
+        total = 0
+        for entry in os.scandir(CACHE_DIR):
+            if entry.name.endswith(".json"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+        
+        if total <= self.max_size_bytes:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_size_bytes:
+                break
+    
+    async def predict_batch(
+        self,
+        queries: List[Tuple[str, str]],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        limiter=None
+    ) -> List:
+        """
+        Predict many (question, category) pairs in one call.
+        Tavily's search API takes a single query per request, so this fans the
+        queries out concurrently, gated by the optional semaphore / rate
+        limiter. Results come back in input order; a failed query yields
+        its exception instead of a prediction.
+        """
+        async def _one(question: str, category: str) -> Dict:
+            async with (semaphore or contextlib.nullcontext()), (limiter or contextlib.nullcontext()):
+                return await self.predict(question, category)
+        
+        return await asyncio.gather(
+            *(_one(q, c) for q, c in queries),
+            return_exceptions=True
+        )
+        
+    async def predict_many(self, markets: List[Tuple[str, str]], concurrency: int = 8) -> List:
+        """
+        Predict many (question, category) pairs with at most `concurrency`
+        searches in flight. Same ordering/error contract as predict_batch.
+        """
+        return await self.predict_batch(markets, semaphore=asyncio.Semaphore(concurrency))
+    
+    async def _search(self, query: str) -> Dict:
+        """Run Tavily search. Returns the decoded response, or {} on failure."""
+        try:
+            response = await self.http.post(TAVILY_URL, json={
+                "api_key": os.environ["TAVILY_API_KEY"],
+                "query": query,
+                "search_depth": "advanced",
+                "max_results": 5,
+                "include_answer": True
+            })
+            response.raise_for_status()
+            return _json.loads(response.content)
+        except KeyError:
+            print("Search error: set TAVILY_API_KEY")
+            return {}
         except Exception as e:
             print(f"Search error: {e}")
-            return ""
+            return {}
     
     def _build_query(self, question: str, category: str) -> str:
         """Build search query."""
-        query = question.lower()
-        for word in ["will", "by", "the", "in", "on", "if", "?", "$", "%"]:
-            query = query.replace(word, " ")
+        query = " ".join(STOP_RE.sub(" ", question.lower()).split())
         
         context = {
             "crypto": "price prediction forecast 2026",
@@ -62,9 +193,12 @@ class WebPredictor:
         
         return query.strip()[:100]
     
-    def _parse_results(self, text: str, question: str) -> Dict:
-        """Parse Tavily markdown output."""
-        if not text:
+    def _parse_results(self, data: Dict, question: str) -> Dict:
+        """Parse a Tavily search response."""
+        results = data.get("results") or []
+        answer = data.get("answer") or ""
+        
+        if not results and not answer:
             return {
                 "prob_yes": 0.5,
                 "confidence": 0.0,
@@ -72,13 +206,9 @@ class WebPredictor:
                 "sentiment": 0.0
             }
         
-        # Extract answer section
-        answer_match = re.search(r'## Answer\s*(.+?)(?=##|$)', text, re.DOTALL)
-        answer = answer_match.group(1).strip()[:500] if answer_match else text[:500]
-        
-        # Extract sources count
-        sources = re.findall(r'- \*\*.+?\*\*', text)
-        num_sources = len(sources)
+        # Answer plus every source's title/content is the text we score
+        text = "\n".join([answer] + [f"{r.get('title', '')} {r.get('content', '')}" for r in results])
+        num_sources = len(results)
         
         # Analyze sentiment
         sentiment = self._analyze_sentiment(text)
@@ -104,26 +234,17 @@ class WebPredictor:
             "confidence": round(confidence, 2),
             "reasoning": reasoning,
             "sentiment": round(sentiment, 2),
-            "answer_preview": answer[:150]
+            "answer_preview": (answer or text)[:150]
         }
     
     def _analyze_sentiment(self, text: str) -> float:
         """Simple sentiment: -1.0 to +1.0"""
-        text = text.lower()
-        
-        bullish = ["bull", "bullish", "rally", "surge", "moon", "strong", "higher", 
-                  "growth", "confident", "expected", "likely", "yes", "reach", 
-                  "target", "predict", "forecast"]
-        bearish = ["bear", "bearish", "crash", "dump", "fall", "lower", "weak", 
-                  "unlikely", "doubt", "correction", "no", "bearish"]
-        
-        pos = sum(1 for w in bullish if w in text)
-        neg = sum(1 for w in bearish if w in text)
+        pos = len(_BULL_RE.findall(text))
+        neg = len(_BEAR_RE.findall(text))
         total = pos + neg
         
         return (pos - neg) / max(total, 1)
 
-
 if __name__ == "__main__":
     import asyncio
     
@@ -134,5 +255,6 @@ if __name__ == "__main__":
             "crypto"
         )
         print(json.dumps(result, indent=2))
+        await p.close()
     
     asyncio.run(test())
@@ -9,6 +9,8 @@ import asyncio
 from typing import Dict, List, Optional
 from brave import web_search  # Using available tool
 
+from utils.constants import STOP_RE
+
 
 class WebPredictor:
     """
@@ -53,9 +55,7 @@ class WebPredictor:
     def _build_query(self, question: str, category: str) -> str:
         """Build search query from market question."""
         # Remove question words, focus on key entities
-        query = question.lower()
-        query = query.replace("will", "").replace("by", "").replace("the", "")
-        query = query.replace("in", "").replace("on", "").replace("if", "")
+        query = " ".join(STOP_RE.sub(" ", question.lower()).split())
         
         # Add category context
         if category == "crypto":
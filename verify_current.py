@@ -4,47 +4,73 @@ import asyncio
 from datetime import datetime, timezone
 from utils.polymarket_api import PolymarketClient
 
+def _live_row(m: dict, now: datetime):
+    """
+    (end_date, days_until, volume_k, question) for a live market.
+    "ENDED" if its end date has passed, None if it has no usable end date.
+    """
+    end_date = m.get("endDate", "")
+    if not end_date:
+        return None
+    
+    try:
+        end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+        if end_dt.tzinfo is None:
+            end_dt = end_dt.replace(tzinfo=timezone.utc)
+        days_until = (end_dt - now).days
+        if days_until < 0:
+            # end_date_min should have excluded this - don't trust it blindly
+            return "ENDED"
+        vol = float(m.get("volume", 0) or 0) / 1000
+    except (TypeError, ValueError):
+        return None
+    
+    return end_date, days_until, vol, m.get("question", "")[:45]
+
 async def main():
+    now = datetime.now(timezone.utc)
+    
     print("="*70)
     print("VERIFYING CURRENT MARKETS")
-    print(f"Today: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
+    print(f"Today: {now.strftime('%Y-%m-%d %H:%M UTC')}")
     print("="*70)
     
+    # Let gamma drop ended markets and return the busiest first
     c = PolymarketClient()
-    markets = await c.get_markets(active=True, limit=100)
+    try:
+        markets = await c.get_markets(
+            active=True,
+            limit=100,
+            end_date_min=now.isoformat(timespec="seconds"),
+            order="volume",
+            ascending=False
+        )
+    finally:
+        await c.close()
     
-    print(f"\nFetched {len(markets)} total markets")
+    print(f"\nFetched {len(markets)} markets (end_date_min filter requested server-side)")
     print("\n" + "="*70)
     print("LIVE MARKETS (end date in future):")
     print("="*70)
     print(f"{'End Date':<12} | {'Days':<5} | {'Volume':<8} | Market")
     print("-"*70)
     
-    live_count = 0
-    now = datetime.now(timezone.utc)
+    # One pass over the payload, then one write to stdout
+    results = [_live_row(m, now) for m in markets]
+    rows = [r for r in results if isinstance(r, tuple)]
+    ended_count = results.count("ENDED")
+    live_count = len(rows)
     
-    for m in markets:
-        end_date = m.get("endDate", "")
-        if not end_date:
-            continue
-            
-        try:
-            end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00')).replace(tzinfo=timezone.utc)
-            days_until = (end_dt - now).days
-            
-            if days_until >= 0:
-                live_count += 1
-                vol = float(m.get("volume", 0) or 0) / 1000
-                q = m.get("question", "")[:45]
-                
-                print(f"{end_date[:10]} | {days_until:>4}d | ${vol:>6.0f}K | {q}...")
-                
-        except Exception as e:
-            continue
+    if rows:
+        print("\n".join(
+            f"{end_date[:10]} | {days_until:>4}d | ${vol:>6.0f}K | {q}..."
+            for end_date, days_until, vol, q in rows
+        ))
     
     print("-"*70)
     print(f"\nFound {live_count} markets with future end dates")
-    print(f"Filtered out {len(markets) - live_count} markets (already ended)")
+    print(f"Filtered out {ended_count} markets (already ended)")
+    print(f"Skipped {len(markets) - live_count - ended_count} markets (missing/invalid end date)")
     
     if live_count == 0:
         print("\n⚠️  WARNING: No live markets found!")